@@ -4,24 +4,49 @@ Minimal web UI for YouTube downloads with batch support.
 - Browse channel (auto /videos) and pick items.
 - Paste arbitrary URLs (one per line).
 - Choose audio/video + format.
-- Starts background jobs; frontend polls status.
-Requires: yt-dlp, ffmpeg in PATH, Flask.
+- Starts background jobs; frontend streams status over SSE.
+Requires: yt-dlp, ffmpeg in PATH, Flask. Uses waitress when installed.
 Run: python app.py  (opens http://127.0.0.1:5000)
 """
+import atexit
+import gzip
+import hashlib
 import json
+import os
+import re
 import threading
+import time
 import uuid
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeout
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlparse
 
 from flask import Flask, Response, jsonify, request
 from yt_dlp import YoutubeDL
 
 app = Flask(__name__)
 FFMPEG_BIN = Path(__file__).parent / "ffmpeg" / "ffmpeg-8.0.1-essentials_build" / "bin"
+_FFMPEG_LOCATION: Optional[str] = str(FFMPEG_BIN) if FFMPEG_BIN.exists() else None
 DEFAULT_WORKERS = 4
 MAX_WORKERS = 8
+MAX_FRAGS = 16
+DEFAULT_FRAGS = max(1, min(int(os.environ.get("CONCURRENT_FRAGS", 8)), MAX_FRAGS))
+
+# One shared pool caps downloads process-wide; jobs throttle themselves with a semaphore.
+GLOBAL_POOL = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="dl")
+atexit.register(GLOBAL_POOL.shutdown, wait=False)
+# Channel listings get their own pool so a busy download queue cannot starve them.
+CHANNEL_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="channel")
+atexit.register(CHANNEL_POOL.shutdown, wait=False)
+CHANNEL_TIMEOUT = 20
+JOB_TTL = 3600
+MAX_JOBS = 1024
+CHANNEL_CACHE_TTL = 120
+CHANNEL_CACHE_SIZE = 64
+CHANNEL_LOOKAHEAD = 30
 
 
 LANG = {
@@ -40,6 +65,7 @@ LANG = {
         "status": "Status",
         "clear": "Clear queue",
         "parallel": "Parallel jobs",
+        "fragments": "Fragments per video",
     },
     "zh": {
         "title": "YouTube 批量下载器",
@@ -56,12 +82,32 @@ LANG = {
         "status": "状态",
         "clear": "清空",
         "parallel": "并行数",
+        "fragments": "单视频分片数",
     },
 }
 
+# jobs_lock guards the registry itself; each job carries its own "lock" for item updates.
+# Finished jobs are swept by _trim_jobs once JOB_TTL has passed, or earlier once more
+# than MAX_JOBS are kept.
 jobs_lock = threading.Lock()
-jobs: Dict[str, dict] = {}
+jobs: OrderedDict[str, dict] = OrderedDict()
+_channel_cache_lock = threading.Lock()
+# channel url -> (fetched_at, entries[0:n], exhausted)
+_channel_cache: Dict[str, Tuple[float, List[dict], bool]] = {}
 
+_HAS_VIDEO_PATH = re.compile(r"/(videos|streams|shorts|playlist|watch)|list=")
+_IS_CHANNEL_ROOT = re.compile(r"/(channel|user|c)/|/@")
+# Query keys that change what gets downloaded; everything else (si, feature, t, ...) is noise.
+_KEEP_QUERY_KEYS = ("v", "list")
+_SCHEMELESS_YOUTUBE = re.compile(r"((www|m)\.)?(youtube\.com|youtu\.be)/", re.IGNORECASE)
+# Prefer a source already in the requested codec; FFmpegExtractAudio then stream-copies
+# it (-c:a copy) instead of re-encoding. YouTube has no mp3 streams, so mp3 still transcodes.
+_AUDIO_SOURCE_FORMATS = {
+    "mp3": "bestaudio/best",
+    "m4a": "bestaudio[ext=m4a]/bestaudio/best",
+    "opus": "bestaudio[acodec=opus]/bestaudio/best",
+}
+
 
 def normalize_channel_url(url: str) -> str:
     """Ensure channel URL points to a list of real videos."""
@@ -73,14 +119,33 @@ def normalize_channel_url(url: str) -> str:
     if url.startswith("youtube.com/"):
         url = "https://" + url
     lower = url.lower().rstrip("/")
-    if any(tag in lower for tag in ["/videos", "/streams", "/shorts", "/playlist", "/watch", "list="]):
+    if _HAS_VIDEO_PATH.search(lower):
         return url
-    if any(key in lower for key in ["/channel/", "/user/", "/c/", "/@"]):
+    if _IS_CHANNEL_ROOT.search(lower):
         return url.rstrip("/") + "/videos"
     return url
+
+
+def canonical_url(url: str) -> str:
+    """Collapse equivalent YouTube watch links so duplicates can be spotted."""
+    full = "https://" + url if _SCHEMELESS_YOUTUBE.match(url) else url
+    try:
+        parts = urlparse(full)
+    except ValueError:
+        return url  # Malformed (e.g. an unclosed IPv6 host); run_job reports it per item.
+    host = parts.netloc.lower()
+    if host.startswith(("www.", "m.")):
+        host = host.split(".", 1)[1]
+    params = dict(parse_qsl(parts.query))
+    if host == "youtu.be" and parts.path.strip("/"):
+        params["v"] = parts.path.strip("/")
+    elif host != "youtube.com" or parts.path != "/watch" or "v" not in params:
+        return url
+    query = [(k, params[k]) for k in _KEEP_QUERY_KEYS if k in params]
+    return f"https://www.youtube.com/watch?{urlencode(query)}"
 
 
-def build_opts(is_video: bool, fmt_choice: str):
+def build_opts(is_video: bool, fmt_choice: str, frags: int = DEFAULT_FRAGS):
     if is_video:
         fmt_map = {
             "best": "bestvideo+bestaudio/best",
@@ -92,15 +157,19 @@ def build_opts(is_video: bool, fmt_choice: str):
             "merge_output_format": "mp4",
             "outtmpl": "%(title)s.%(ext)s",
             "quiet": True,
+            "concurrent_fragment_downloads": frags,
+            "http_chunk_size": 10 * 1024 * 1024,
         }
-        if FFMPEG_BIN.exists():
-            opts["ffmpeg_location"] = str(FFMPEG_BIN)
+        if _FFMPEG_LOCATION:
+            opts["ffmpeg_location"] = _FFMPEG_LOCATION
         return opts
     codec = {"mp3": "mp3", "m4a": "m4a", "opus": "opus"}.get(fmt_choice, "mp3")
     opts = {
-        "format": "bestaudio/best",
+        "format": _AUDIO_SOURCE_FORMATS[codec],
         "outtmpl": "%(title)s.%(ext)s",
         "quiet": True,
+        "concurrent_fragment_downloads": frags,
+        "http_chunk_size": 10 * 1024 * 1024,
         "postprocessors": [
             {
                 "key": "FFmpegExtractAudio",
@@ -109,60 +178,130 @@ def build_opts(is_video: bool, fmt_choice: str):
             }
         ],
     }
-    if FFMPEG_BIN.exists():
-        opts["ffmpeg_location"] = str(FFMPEG_BIN)
+    if _FFMPEG_LOCATION:
+        opts["ffmpeg_location"] = _FFMPEG_LOCATION
     return opts
 
 
-def fetch_channel_entries(channel_url: str, start: int, count: int) -> List[dict]:
+def _fetch(channel_url: str, start: int, count: int) -> List[dict]:
     ydl_opts = {
         "quiet": True,
-        "extract_flat": True,
+        "extract_flat": "in_playlist",
         "skip_download": True,
-        "playliststart": start + 1,
-        "playlistend": start + count,
+        "playlist_items": f"{start + 1}:{start + count}",
+        "lazy_playlist": True,
     }
     with YoutubeDL(ydl_opts) as ydl:
         info = ydl.extract_info(channel_url, download=False)
     return info.get("entries", [])
+
+
+def fetch_channel_entries(channel_url: str, start: int, count: int) -> List[dict]:
+    """Return one page of entries, sliced from a cached window of the channel.
+
+    The window grows by whole extractor calls (with CHANNEL_LOOKAHEAD extra entries)
+    only when a page runs past it, and is dropped after CHANNEL_CACHE_TTL.
+    """
+    end = start + count
+    with _channel_cache_lock:
+        hit = _channel_cache.get(channel_url)
+    if hit and time.monotonic() - hit[0] < CHANNEL_CACHE_TTL:
+        fetched_at, entries, exhausted = hit
+    else:
+        fetched_at, entries, exhausted = time.monotonic(), [], False
+    if len(entries) < end and not exhausted:
+        want = end + CHANNEL_LOOKAHEAD - len(entries)
+        more = _fetch(channel_url, len(entries), want)
+        entries = entries + more
+        exhausted = len(more) < want
+        with _channel_cache_lock:
+            _channel_cache.pop(channel_url, None)
+            _channel_cache[channel_url] = (fetched_at, entries, exhausted)
+            while len(_channel_cache) > CHANNEL_CACHE_SIZE:
+                del _channel_cache[next(iter(_channel_cache))]
+    return entries[start:end]
+
+
+def prefetch_channel_entries(channel_url: str, start: int, count: int) -> None:
+    try:
+        fetch_channel_entries(channel_url, start, count)
+    except Exception:  # pragma: no cover - best effort; the real request reports errors
+        pass
 
 
-def run_job(job_id: str, urls: List[str], is_video: bool, fmt_choice: str, workers: int):
-    def download_one(u: str):
+def publish_snapshot(job: dict) -> None:
+    """Replace the job's read-only view and wake event streams; call with job["lock"] held."""
+    job["snapshot"] = {
+        "id": job["id"],
+        "status": job["status"],
+        "workers": job["workers"],
+        "frags": job["frags"],
+        "items": tuple(dict(i) for i in job["items"]),
+    }
+    job["changed"].notify_all()
+
+
+def _expired(job: dict) -> bool:
+    finished_at = job.get("finished_at")
+    return finished_at is not None and time.monotonic() - finished_at >= JOB_TTL
+
+
+def _trim_jobs() -> None:
+    """Drop expired jobs, then the oldest finished ones beyond MAX_JOBS; call with jobs_lock held."""
+    for jid in [jid for jid, j in jobs.items() if _expired(j)]:
+        del jobs[jid]
+    excess = len(jobs) - MAX_JOBS
+    if excess <= 0:
+        return
+    finished = [jid for jid, j in jobs.items() if j["snapshot"]["status"] in ("done", "error")]
+    for jid in finished[:excess]:
+        del jobs[jid]
+
+
+def run_job(
+    job_id: str, urls: List[str], is_video: bool, fmt_choice: str, workers: int, frags: int
+):
+    slots = threading.Semaphore(workers)
+
+    def download_one(idx: int, u: str, opts: dict):
         try:
-            opts = build_opts(is_video, fmt_choice)
             with YoutubeDL(opts) as ydl:
                 ydl.download([u])
-            return "done", ""
+            status, message = "done", ""
         except Exception as exc:  # pragma: no cover - runtime error display
-            return "error", str(exc)
+            status, message = "error", str(exc)
+        finally:
+            slots.release()
+        with job["lock"]:
+            job_item = job["items"][idx]
+            job_item["status"] = status
+            job_item["message"] = message
+            publish_snapshot(job)
 
     with jobs_lock:
         job = jobs.get(job_id)
-        if not job:
-            return
+    if not job:
+        return
+    with job["lock"]:
         job["status"] = "running"
         job["items"] = [{"url": u, "status": "pending", "message": ""} for u in urls]
+        publish_snapshot(job)
 
-    with ThreadPoolExecutor(max_workers=workers) as executor:
-        future_map = {}
-        for idx, item in enumerate(job["items"]):
+    opts_template = build_opts(is_video, fmt_choice, frags)
+    futures = []
+    for idx, item in enumerate(job["items"]):
+        # Wait for a slot before submitting so a throttled job never parks a shared thread.
+        slots.acquire()
+        with job["lock"]:
             item["status"] = "running"
-            future_map[executor.submit(download_one, item["url"])] = idx
-
-        for future in as_completed(future_map):
-            idx = future_map[future]
-            status, message = future.result()
-            with jobs_lock:
-                if job_id not in jobs:
-                    continue
-                job_item = job["items"][idx]
-                job_item["status"] = status
-                job_item["message"] = message
+            publish_snapshot(job)
+        futures.append(GLOBAL_POOL.submit(download_one, idx, item["url"], dict(opts_template)))
+    wait(futures)
 
-    with jobs_lock:
-        if job_id in jobs:
-            job["status"] = "done" if all(i["status"] == "done" for i in job["items"]) else "error"
+    with job["lock"]:
+        job["status"] = "done" if all(i["status"] == "done" for i in job["items"]) else "error"
+        job["finished_at"] = time.monotonic()
+        publish_snapshot(job)
 
 
 @app.route("/api/channel")
@@ -172,15 +311,22 @@ def api_channel():
     count = int(request.args.get("count", "10"))
     url = normalize_channel_url(raw_url)
     try:
-        entries = fetch_channel_entries(url, start, count)
+        future = CHANNEL_POOL.submit(fetch_channel_entries, url, start, count)
+        entries = future.result(timeout=CHANNEL_TIMEOUT)
+        if len(entries) == count:
+            # Users mostly page forward, so warm the next page while they read this one.
+            CHANNEL_POOL.submit(prefetch_channel_entries, url, start + count, count)
         simplified = [
             {
                 "title": e.get("title", "N/A"),
-                "url": e.get("url") or e.get("webpage_url"),
+                # Flat entries sometimes only carry the video id.
+                "url": e.get("url") or e.get("webpage_url") or f"https://youtu.be/{e.get('id', '')}",
             }
             for e in entries
         ]
         return jsonify({"entries": simplified})
+    except FutureTimeout:
+        return jsonify({"error": "Timed out listing channel"}), 504
     except Exception as exc:  # pragma: no cover - runtime error display
         return jsonify({"error": str(exc)}), 400
 
@@ -188,7 +334,8 @@ def api_channel():
 @app.route("/api/download", methods=["POST"])
 def api_download():
     data = request.get_json(force=True, silent=True) or {}
-    urls = [u.strip() for u in data.get("urls", []) if u and u.strip()]
+    urls = [canonical_url(u.strip()) for u in data.get("urls", []) if u and u.strip()]
+    urls = list(dict.fromkeys(urls))
     mode = data.get("mode", "video")
     fmt_choice = data.get("format", "best")
     workers = data.get("workers", DEFAULT_WORKERS)
@@ -196,34 +343,74 @@ def api_download():
         workers = max(1, min(int(workers), MAX_WORKERS))
     except Exception:
         workers = DEFAULT_WORKERS
+    frags = data.get("frags", DEFAULT_FRAGS)
+    try:
+        frags = max(1, min(int(frags), MAX_FRAGS))
+    except Exception:
+        frags = DEFAULT_FRAGS
     if not urls:
         return jsonify({"error": "No URLs provided"}), 400
     job_id = str(uuid.uuid4())
+    lock = threading.Lock()
+    job = {
+        "id": job_id,
+        "status": "pending",
+        "items": [],
+        "workers": workers,
+        "frags": frags,
+        "lock": lock,
+        "changed": threading.Condition(lock),
+    }
+    with lock:
+        publish_snapshot(job)
     with jobs_lock:
-        jobs[job_id] = {
-            "id": job_id,
-            "status": "pending",
-            "items": [],
-            "workers": workers,
-        }
+        jobs[job_id] = job
+        _trim_jobs()
     thread = threading.Thread(
-        target=run_job, args=(job_id, urls, mode == "video", fmt_choice, workers), daemon=True
+        target=run_job,
+        args=(job_id, urls, mode == "video", fmt_choice, workers, frags),
+        daemon=True,
     )
     thread.start()
-    return jsonify({"job_id": job_id})
+    return jsonify({"job_id": job_id}), 202, {"Location": f"/api/jobs/{job_id}"}
 
 
 @app.route("/api/jobs/<job_id>")
 def api_job(job_id: str):
-    with jobs_lock:
-        job = jobs.get(job_id)
-    if not job:
+    # Lock-free: workers swap in a fresh snapshot dict, so a single read is consistent.
+    job = jobs.get(job_id)
+    # Expired jobs are only removed by the next _trim_jobs sweep; hide them until then.
+    if not job or _expired(job):
         return jsonify({"error": "Job not found"}), 404
-    return jsonify(job)
+    return jsonify(job["snapshot"])
+
+
+@app.route("/api/jobs/<job_id>/events")
+def api_job_events(job_id: str):
+    job = jobs.get(job_id)
+    if not job or _expired(job):
+        return jsonify({"error": "Job not found"}), 404
+
+    def stream():
+        last = None
+        while True:
+            with job["changed"]:
+                if job["snapshot"] is last:
+                    job["changed"].wait(timeout=30)
+                snapshot = job["snapshot"]
+            if snapshot is last:
+                # Comment line keeps proxies from closing an idle stream.
+                yield ": keepalive\n\n"
+                continue
+            last = snapshot
+            yield f"data: {json.dumps(snapshot)}\n\n"
+            if snapshot["status"] in ("done", "error"):
+                return
+
+    return Response(stream(), mimetype="text/event-stream", headers={"Cache-Control": "no-cache"})
 
 
-@app.route("/")
-def index():
+def _build_index() -> str:
     # Inline HTML for simplicity; avoids external assets.
     html = """<!doctype html>
 <html lang="en">
@@ -450,6 +637,11 @@ def index():
         <select id="workers" style="width:120px;"></select>
         <span class="chip">max __MAX_WORKERS__</span>
       </div>
+      <div style="display:flex; gap:10px; align-items:center; margin:0 0 6px;">
+        <span id="frags-label" class="chip" style="border:none; padding:0;">__FRAGMENTS__</span>
+        <select id="frags" style="width:120px;"></select>
+        <span class="chip">max __MAX_FRAGS__</span>
+      </div>
       <div class="list" id="queue-list"></div>
     </div>
     <div class="card">
@@ -465,6 +657,8 @@ def index():
     const LANG = __JSON_LANG__;
     const DEFAULT_WORKERS = __DEFAULT_WORKERS__;
     const MAX_WORKERS = __MAX_WORKERS__;
+    const DEFAULT_FRAGS = __DEFAULT_FRAGS__;
+    const MAX_FRAGS = __MAX_FRAGS__;
     let lang = 'en';
     let queue = [];
     let queueSet = new Set();
@@ -472,6 +666,10 @@ def index():
     let channelPage = 0;
     let lastChannelUrl = '';
     let activeJob = null;
+    let jobEvents = null;
+    let queueRows = new Map(); // url -> row element
+    let statusRows = new Map(); // url -> row element
+    let statusJobId = null;
 
     function setLang(code) {{
       lang = code;
@@ -491,10 +689,13 @@ def index():
       document.getElementById('status-label').textContent = t.status;
       const parallel = document.getElementById('parallel-label');
       if (parallel) parallel.textContent = t.parallel;
+      const frags = document.getElementById('frags-label');
+      if (frags) frags.textContent = t.fragments;
       document.querySelector('button[onclick="startDownload()"]').textContent = t.download;
       document.querySelector('button[onclick="clearQueue()"]').textContent = t.clear;
       refreshFormats();
       refreshWorkers();
+      refreshFrags();
       renderQueue();
     }}
 
@@ -515,6 +716,7 @@ def index():
     function onModeChange() {{ refreshFormats(); }}
     refreshFormats();
     refreshWorkers();
+    refreshFrags();
 
     function refreshWorkers() {{
       const sel = document.getElementById('workers');
@@ -531,6 +733,21 @@ def index():
       if (!sel.value) sel.value = DEFAULT_WORKERS;
     }}
 
+    function refreshFrags() {{
+      const sel = document.getElementById('frags');
+      if (!sel) return;
+      const current = parseInt(sel.value || DEFAULT_FRAGS, 10);
+      sel.innerHTML = '';
+      for (let i = 1; i <= MAX_FRAGS; i++) {{
+        const opt = document.createElement('option');
+        opt.value = i;
+        opt.textContent = `${{i}}x`;
+        if (i === current) opt.selected = true;
+        sel.appendChild(opt);
+      }}
+      if (!sel.value) sel.value = DEFAULT_FRAGS;
+    }}
+
     async function fetchChannel() {{
       const url = document.getElementById('channel-url').value.trim();
       if (!url) return;
@@ -600,22 +817,41 @@ def index():
     }}
 
     function renderQueue() {{
+      // Queue only grows at the end or loses items, so existing rows never need reordering.
       const list = document.getElementById('queue-list');
-      list.innerHTML = '';
+      queueRows.forEach((row, url) => {{
+        if (!queueSet.has(url)) {{
+          row.remove();
+          queueRows.delete(url);
+        }}
+      }});
+      const fresh = document.createDocumentFragment();
       queue.forEach((item, i) => {{
-        const row = document.createElement('div');
-        row.className = 'row';
-        row.innerHTML = `
-          <div class="title">${{i+1}}. ${{item.title || item.url}}</div>
-          <button class="secondary" onclick="removeFromQueue(${{i}})">x</button>
-        `;
-        list.appendChild(row);
+        let row = queueRows.get(item.url);
+        if (!row) {{
+          row = document.createElement('div');
+          row.className = 'row';
+          const title = document.createElement('div');
+          title.className = 'title';
+          const btn = document.createElement('button');
+          btn.className = 'secondary';
+          btn.textContent = 'x';
+          btn.onclick = () => removeFromQueue(item.url);
+          row.append(title, btn);
+          queueRows.set(item.url, row);
+          fresh.appendChild(row);
+        }}
+        const text = `${{i+1}}. ${{item.title || item.url}}`;
+        const title = row.firstChild;
+        if (title.textContent !== text) title.textContent = text;
       }});
+      list.appendChild(fresh);
     }}
 
-    function removeFromQueue(idx) {{
-      if (queue[idx]) queueSet.delete(queue[idx].url);
-      queue.splice(idx, 1);
+    function removeFromQueue(url) {{
+      const idx = queue.findIndex(q => q.url === url);
+      if (idx !== -1) queue.splice(idx, 1);
+      queueSet.delete(url);
       renderQueue();
     }}
 
@@ -624,11 +860,12 @@ def index():
       const mode = document.getElementById('mode').value;
       const format = document.getElementById('format').value;
       const workers = parseInt(document.getElementById('workers').value || DEFAULT_WORKERS, 10);
+      const frags = parseInt(document.getElementById('frags').value || DEFAULT_FRAGS, 10);
       const urls = queue.map(q => q.url);
       const resp = await fetch('/api/download', {{
         method: 'POST',
         headers: {{ 'Content-Type': 'application/json' }},
-        body: JSON.stringify({{ urls, mode, format, workers }})
+        body: JSON.stringify({{ urls, mode, format, workers, frags }})
       }});
       const data = await resp.json();
       if (data.error) {{
@@ -637,29 +874,52 @@ def index():
       }}
       activeJob = data.job_id;
       document.getElementById('job-id').textContent = data.job_id;
-      pollJob();
+      watchJob();
     }}
 
-    async function pollJob() {{
+    function watchJob() {{
       if (!activeJob) return;
-      const resp = await fetch(`/api/jobs/${{activeJob}}`);
-      if (!resp.ok) return;
-      const data = await resp.json();
+      if (jobEvents) jobEvents.close();
+      jobEvents = new EventSource(`/api/jobs/${{activeJob}}/events`);
+      jobEvents.onmessage = (ev) => {{
+        const data = JSON.parse(ev.data);
+        renderStatus(data);
+        if (data.status === 'done' || data.status === 'error') {{
+          jobEvents.close();
+          jobEvents = null;
+        }}
+      }};
+    }}
+
+    function renderStatus(data) {{
       const list = document.getElementById('status-list');
-      list.innerHTML = '';
+      if (statusJobId !== data.id) {{
+        statusJobId = data.id;
+        statusRows = new Map();
+        list.innerHTML = '';
+      }}
+      const fresh = document.createDocumentFragment();
       data.items.forEach((item, idx) => {{
-        const row = document.createElement('div');
-        row.className = 'row';
-        const statusClass = item.status === 'done' ? 'done' : item.status === 'error' ? 'error' : 'muted';
-        row.innerHTML = `
-          <div class="title">${{idx+1}}. ${{item.url}}</div>
-          <span class="status-pill ${{statusClass}}">${{item.status}}</span>
-        `;
-        list.appendChild(row);
+        let row = statusRows.get(item.url);
+        if (!row) {{
+          row = document.createElement('div');
+          row.className = 'row';
+          row.innerHTML = `
+            <div class="title">${{idx+1}}. ${{item.url}}</div>
+            <span class="status-pill"></span>
+          `;
+          statusRows.set(item.url, row);
+          fresh.appendChild(row);
+        }}
+        if (row.dataset.status !== item.status) {{
+          row.dataset.status = item.status;
+          const pill = row.querySelector('.status-pill');
+          const statusClass = item.status === 'done' ? 'done' : item.status === 'error' ? 'error' : 'muted';
+          pill.className = `status-pill ${{statusClass}}`;
+          pill.textContent = item.status;
+        }}
       }});
-      if (data.status !== 'done' && data.status !== 'error') {{
-        setTimeout(pollJob, 1200);
-      }}
+      list.appendChild(fresh);
     }}
   </script>
 </body>
@@ -683,12 +943,44 @@ def index():
         .replace("__DOWNLOAD__", LANG["en"]["download"])
         .replace("__STATUS__", LANG["en"]["status"])
         .replace("__PARALLEL__", LANG["en"]["parallel"])
+        .replace("__FRAGMENTS__", LANG["en"]["fragments"])
         .replace("__DEFAULT_WORKERS__", str(DEFAULT_WORKERS))
         .replace("__MAX_WORKERS__", str(MAX_WORKERS))
+        .replace("__DEFAULT_FRAGS__", str(DEFAULT_FRAGS))
+        .replace("__MAX_FRAGS__", str(MAX_FRAGS))
         .replace("__JSON_LANG__", json.dumps(LANG, ensure_ascii=False))
     )
-    return Response(html, mimetype="text/html")
+    return html
+
+
+# The page only depends on module constants, so render it once at import.
+_INDEX_HTML_BYTES = _build_index().encode("utf-8")
+_INDEX_ETAG = hashlib.blake2b(_INDEX_HTML_BYTES, digest_size=8).hexdigest()
+_INDEX_HEADERS = {
+    "Cache-Control": "public, max-age=3600",
+    "Vary": "Accept-Encoding",
+    "ETag": f'"{_INDEX_ETAG}"',
+}
+_INDEX_GZ = gzip.compress(_INDEX_HTML_BYTES, compresslevel=9)
+_INDEX_GZ_ETAG = f"{_INDEX_ETAG}-gz"
+_INDEX_GZ_HEADERS = {**_INDEX_HEADERS, "Content-Encoding": "gzip", "ETag": f'"{_INDEX_GZ_ETAG}"'}
+
+
+@app.route("/")
+def index():
+    if request.accept_encodings["gzip"]:
+        body, etag, headers = _INDEX_GZ, _INDEX_GZ_ETAG, _INDEX_GZ_HEADERS
+    else:
+        body, etag, headers = _INDEX_HTML_BYTES, _INDEX_ETAG, _INDEX_HEADERS
+    if request.if_none_match.contains(etag):
+        return Response(status=304, headers=headers)
+    return Response(body, mimetype="text/html", headers=headers)
 
 
 if __name__ == "__main__":
-    app.run(host="127.0.0.1", port=5000, debug=False)
+    try:
+        from waitress import serve
+    except ImportError:
+        app.run(host="127.0.0.1", port=5000, debug=False, threaded=True)
+    else:
+        serve(app, host="127.0.0.1", port=5000, threads=16, ident=None)
@@ -1,31 +1,84 @@
 #!/usr/bin/env python3
 """
 Simple YouTube downloader: video/audio selection, channel browser with paging,
-multi-language prompts (en/zh/es). Tested with yt-dlp.
+parallel multi-URL downloads, multi-language prompts (en/zh/es). Tested with yt-dlp.
 """
+import asyncio
+import atexit
+import copy
+import functools
+import hashlib
+import json
+import os
+import re
+import shutil
 import sys
+import threading
+import time
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 try:
     from yt_dlp import YoutubeDL
+    from yt_dlp.utils import DownloadCancelled
 except ImportError:
     print("Please install yt-dlp first: pip install yt-dlp")
     sys.exit(1)
 
+try:
+    import orjson  # Optional: faster channel cache reads and writes.
+except ImportError:
+    orjson = None
+
 FFMPEG_BIN = Path(__file__).parent / "ffmpeg" / "ffmpeg-8.0.1-essentials_build" / "bin"
+_FFMPEG_LOCATION: Optional[str] = str(FFMPEG_BIN) if FFMPEG_BIN.exists() else None
+MAX_FRAGMENTS = 16
+CONCURRENT_FRAGMENTS = max(1, min(int(os.environ.get("YDL_CONCURRENT_FRAGMENTS", 8)), MAX_FRAGMENTS))
+# aria2c is picked up from PATH unless YDL_USE_ARIA2C=0.
+ARIA2C = shutil.which("aria2c") if os.environ.get("YDL_USE_ARIA2C", "1") != "0" else None
+DOWNLOAD_WORKERS = max(1, int(os.environ.get("YDL_DOWNLOAD_WORKERS", 4)))
+CHANNEL_FETCH_WORKERS = 8
+CHANNEL_CACHE_FILE = Path.home() / ".cache" / "yt-downloader" / "channels.json"
+CHANNEL_CACHE_TTL = 300
+_LANG_MAP = {"1": "en", "2": "zh", "3": "es"}
+_VIDEO_FMT_MAP = {
+    "1": "bestvideo+bestaudio/best",
+    "2": "bestvideo[height<=1080]+bestaudio/best",
+    "3": "bestvideo[height<=720]+bestaudio/best",
+}
+_AUDIO_CODEC_MAP = {"1": "mp3", "2": "m4a", "3": "opus"}
+# Audio source per target codec, picked so the extractor can copy rather than transcode.
+_AUDIO_SOURCE_FORMATS = {
+    "mp3": "bestaudio/best",
+    "m4a": "bestaudio[ext=m4a]/bestaudio/best",
+    "opus": "bestaudio[acodec=opus]/bestaudio/best",
+}
+_HAS_VIDEO_PATH = re.compile(r"/(videos|streams|shorts|playlist|watch)|list=")
+_IS_CHANNEL_ROOT = re.compile(r"/(channel|user|c)/|/@")
+# Only these entry fields are shown or downloaded, so only these are cached.
+_CACHED_FIELDS = ("id", "title", "url", "webpage_url")
+# Options for walking a channel once; process=False keeps the entries a lazy generator.
+_BROWSE_OPTS = {
+    "quiet": True,
+    "extract_flat": "in_playlist",
+    "lazy_playlist": True,
+    "skip_download": True,
+}
 
 LANG = {
     "en": {
         "choose_lang": "Choose language: 1) English 2) 简体中文 3) Español : ",
-        "menu": "\n1) Download by URL\n2) Browse channel (list top 10)\n3) Quit\nSelect: ",
+        "menu": "\n1) Download by URL\n2) Browse channel (list top 10)\n3) Download multiple URLs\n4) Browse several channels\n5) Quit\nSelect: ",
         "enter_url": "Enter a YouTube video URL: ",
+        "enter_urls": "Enter URLs (comma-separated or one per line, empty line to finish):",
+        "enter_channels": "Enter channel URLs (comma-separated or one per line, empty line to finish):",
         "enter_channel": "Enter a YouTube channel URL (channel/handle/user): ",
         "choose_av": "Choose: 1) Video 2) Audio : ",
         "video_fmt": "Video format: 1) best 2) 1080p 3) 720p : ",
         "audio_fmt": "Audio format: 1) mp3 2) m4a 3) opus : ",
         "list_title": "\nTop {count} videos:",
-        "more": "m) More  q) Back  number) Download : ",
+        "more": "m) More  r) Refresh  q) Back  number) Download : ",
         "downloading": "Downloading...",
         "done": "Done.",
         "invalid": "Invalid choice.",
@@ -33,14 +86,16 @@ LANG = {
     },
     "zh": {
         "choose_lang": "选择语言: 1) English 2) 简体中文 3) Español : ",
-        "menu": "\n1) 按URL下载\n2) 浏览频道(列出前10条)\n3) 退出\n请选择: ",
+        "menu": "\n1) 按URL下载\n2) 浏览频道(列出前10条)\n3) 批量下载多个URL\n4) 浏览多个频道\n5) 退出\n请选择: ",
         "enter_url": "输入YouTube视频链接: ",
+        "enter_urls": "输入多个链接(逗号分隔或一行一个，空行结束):",
+        "enter_channels": "输入多个频道链接(逗号分隔或一行一个，空行结束):",
         "enter_channel": "输入频道链接(可用channel/handle/user): ",
         "choose_av": "选择: 1) 视频 2) 音频 : ",
         "video_fmt": "视频格式: 1) 最佳 2) 1080p 3) 720p : ",
         "audio_fmt": "音频格式: 1) mp3 2) m4a 3) opus : ",
         "list_title": "\n前{count}条视频:",
-        "more": "m) 更多  q) 返回  编号) 下载 : ",
+        "more": "m) 更多  r) 刷新  q) 返回  编号) 下载 : ",
         "downloading": "下载中...",
         "done": "完成。",
         "invalid": "无效选择。",
@@ -48,14 +103,16 @@ LANG = {
     },
     "es": {
         "choose_lang": "Elige idioma: 1) English 2) 简体中文 3) Español : ",
-        "menu": "\n1) Descargar por URL\n2) Ver canal (top 10)\n3) Salir\nSelecciona: ",
+        "menu": "\n1) Descargar por URL\n2) Ver canal (top 10)\n3) Descargar varias URLs\n4) Ver varios canales\n5) Salir\nSelecciona: ",
         "enter_url": "Pega el enlace de YouTube: ",
+        "enter_urls": "Pega las URLs (separadas por comas o una por línea, línea vacía para terminar):",
+        "enter_channels": "URLs de canales (separadas por comas o una por línea, línea vacía para terminar):",
         "enter_channel": "URL del canal (channel/handle/user): ",
         "choose_av": "Elige: 1) Video 2) Audio : ",
         "video_fmt": "Formato de video: 1) mejor 2) 1080p 3) 720p : ",
         "audio_fmt": "Formato de audio: 1) mp3 2) m4a 3) opus : ",
         "list_title": "\nTop {count} videos:",
-        "more": "m) Más  q) Volver  número) Descargar : ",
+        "more": "m) Más  r) Actualizar  q) Volver  número) Descargar : ",
         "downloading": "Descargando...",
         "done": "Listo.",
         "invalid": "Opción inválida.",
@@ -63,10 +120,62 @@ LANG = {
     },
 }
 
+# "sha1(url):start:count" -> [saved_at, entries]; loaded from disk on first use.
+# _channel_cache_lock is held while reading or writing it (yt-dlp runs in worker threads).
+_channel_cache: Optional[Dict[str, list]] = None
+_channel_cache_lock = threading.Lock()
+# opts signature -> idle YoutubeDL instances. Building one is slow, so they are reused;
+# a download checks one out, so parallel downloads never share an instance.
+_idle_ydls: Dict[str, List[YoutubeDL]] = {}
+_all_ydls: List[YoutubeDL] = []
+_ydls_lock = threading.Lock()
+# Set on Ctrl+C; every download checks it from its progress hook.
+_cancel_downloads = threading.Event()
+
+
+def _settle(future: asyncio.Future, result, exc: Optional[BaseException]):
+    if future.cancelled():
+        return
+    if exc is not None:
+        future.set_exception(exc)
+    else:
+        future.set_result(result)
+
+
+async def _in_thread(func, *args):
+    """Like asyncio.to_thread, but on a daemon thread so Ctrl+C never waits for it.
+
+    Executor threads are joined at exit, which would keep the CLI alive until every
+    in-flight download finished.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def run():
+        try:
+            result, exc = func(*args), None
+        except BaseException as err:
+            result, exc = None, err
+        try:
+            loop.call_soon_threadsafe(_settle, future, result, exc)
+        except RuntimeError:
+            pass  # The loop already closed; nobody is waiting for this result.
 
-def pick_lang() -> str:
-    choice = input(LANG["en"]["choose_lang"]).strip()
-    return {"1": "en", "2": "zh", "3": "es"}.get(choice, "en")
+    threading.Thread(target=run, daemon=True).start()
+    return await future
+
+
+async def ainput(prompt: str = "") -> str:
+    # Yield once so freshly created tasks start their threads before input() blocks the
+    # loop; those fetches keep going and are picked up once the user answers. input()
+    # stays on the main thread so Ctrl+C interrupts it at once.
+    await asyncio.sleep(0)
+    return input(prompt)
+
+
+async def pick_lang() -> str:
+    choice = (await ainput(LANG["en"]["choose_lang"])).strip()
+    return _LANG_MAP.get(choice, "en")
 
 
 def normalize_channel_url(url: str) -> str:
@@ -80,32 +189,34 @@ def normalize_channel_url(url: str) -> str:
         url = "https://" + url
     lower = url.lower().rstrip("/")
     # If it already points to a list, keep as-is
-    if any(tag in lower for tag in ["/videos", "/streams", "/shorts", "/playlist", "/watch", "list="]):
+    if _HAS_VIDEO_PATH.search(lower):
         return url
-    if any(key in lower for key in ["/channel/", "/user/", "/c/", "/@"]):
+    if _IS_CHANNEL_ROOT.search(lower):
         return url.rstrip("/") + "/videos"
     return url
 
 
-def build_opts(is_video: bool, fmt_choice: str, text: Dict[str, str]):
+@functools.lru_cache(maxsize=8)
+def build_opts(is_video: bool, fmt_choice: str) -> dict:
+    """Return yt-dlp options; the dict is shared between calls, so copy before changing it."""
     if is_video:
-        fmt_map = {
-            "1": "bestvideo+bestaudio/best",
-            "2": "bestvideo[height<=1080]+bestaudio/best",
-            "3": "bestvideo[height<=720]+bestaudio/best",
-        }
         opts = {
-            "format": fmt_map.get(fmt_choice, fmt_map["1"]),
+            "format": _VIDEO_FMT_MAP.get(fmt_choice, _VIDEO_FMT_MAP["1"]),
             "merge_output_format": "mp4",
             "outtmpl": "%(title)s.%(ext)s",
+            "concurrent_fragment_downloads": CONCURRENT_FRAGMENTS,
         }
-        if FFMPEG_BIN.exists():
-            opts["ffmpeg_location"] = str(FFMPEG_BIN)
+        if _FFMPEG_LOCATION:
+            opts["ffmpeg_location"] = _FFMPEG_LOCATION
+        if ARIA2C:
+            opts["external_downloader"] = {"default": "aria2c"}
+            opts["external_downloader_args"] = {"aria2c": ["-x", "16", "-s", "16", "-k", "1M"]}
         return opts
-    codec = {"1": "mp3", "2": "m4a", "3": "opus"}.get(fmt_choice, "mp3")
+    codec = _AUDIO_CODEC_MAP.get(fmt_choice, "mp3")
     opts = {
-        "format": "bestaudio/best",
+        "format": _AUDIO_SOURCE_FORMATS[codec],
         "outtmpl": "%(title)s.%(ext)s",
+        "concurrent_fragment_downloads": CONCURRENT_FRAGMENTS,
         "postprocessors": [
             {
                 "key": "FFmpegExtractAudio",
@@ -114,99 +225,398 @@ def build_opts(is_video: bool, fmt_choice: str, text: Dict[str, str]):
             }
         ],
     }
-    if FFMPEG_BIN.exists():
-        opts["ffmpeg_location"] = str(FFMPEG_BIN)
+    if _FFMPEG_LOCATION:
+        opts["ffmpeg_location"] = _FFMPEG_LOCATION
+    if ARIA2C:
+        opts["external_downloader"] = {"default": "aria2c"}
+        opts["external_downloader_args"] = {"aria2c": ["-x", "16", "-s", "16", "-k", "1M"]}
     return opts
 
 
-def download(url: str, is_video: bool, fmt_choice: str, text: Dict[str, str]):
+async def read_urls(prompt: str) -> List[str]:
+    print(prompt)
+    urls: List[str] = []
+    while True:
+        line = (await ainput()).strip()
+        if not line:
+            break
+        urls.extend(u.strip() for u in line.split(",") if u.strip())
+    return list(dict.fromkeys(urls))
+
+
+def _acquire_ydl(opts: dict) -> Tuple[str, YoutubeDL]:
+    key = json.dumps(opts, sort_keys=True)
+    with _ydls_lock:
+        idle = _idle_ydls.setdefault(key, [])
+        if idle:
+            return key, idle.pop()
+    # YoutubeDL writes into its params dict, so never hand it a shared options dict.
+    params = copy.deepcopy(opts)
+    params["progress_hooks"] = [_check_cancelled]
+    ydl = YoutubeDL(params)
+    with _ydls_lock:
+        _all_ydls.append(ydl)
+    return key, ydl
+
+
+def _release_ydl(key: str, ydl: YoutubeDL):
+    with _ydls_lock:
+        _idle_ydls[key].append(ydl)
+
+
+@atexit.register
+def _close_ydls():
+    for ydl in _all_ydls:
+        ydl.close()
+
+
+def _check_cancelled(_status: dict):
+    # Hooks run on the download thread, so raising here aborts that download.
+    if _cancel_downloads.is_set():
+        raise DownloadCancelled()
+
+
+def _download_one(url: str, opts: dict):
+    # YoutubeDL instances are not reentrant, so each one serves a single task at a time.
+    key, ydl = _acquire_ydl(opts)
+    try:
+        ydl.download([url])
+    finally:
+        _release_ydl(key, ydl)
+
+
+async def download(urls: List[str], is_video: bool, fmt_choice: str, text: Dict[str, str]):
     print(text["downloading"])
-    opts = build_opts(is_video, fmt_choice, text)
+    opts = build_opts(is_video, fmt_choice)
+    batch = len(urls) > 1
+    if batch:
+        # Progress bars from parallel downloads would interleave; report per URL instead.
+        opts = {**opts, "quiet": True, "noprogress": True}
+    slots = asyncio.Semaphore(DOWNLOAD_WORKERS)
+
+    async def download_url(url: str):
+        async with slots:
+            try:
+                # yt-dlp has no async API, so each download runs in a worker thread.
+                await _in_thread(_download_one, url, opts)
+                msg = text["done"]
+            except Exception as exc:
+                msg = text["error"].format(msg=exc)
+        print(f"{url}: {msg}" if batch else msg)
+
+    await asyncio.gather(*(download_url(u) for u in urls))
+
+
+def _cache_key(channel_url: str, start: int, count: int) -> str:
+    digest = hashlib.sha1(channel_url.encode("utf-8")).hexdigest()
+    return f"{digest}:{start}:{count}"
+
+
+def _json_loads(data: bytes):
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def _load_channel_cache() -> Dict[str, list]:
+    global _channel_cache
+    if _channel_cache is None:
+        try:
+            with open(CHANNEL_CACHE_FILE, "rb") as fh:
+                if hasattr(os, "posix_fadvise"):
+                    # Read once front to back; let the kernel read ahead aggressively.
+                    os.posix_fadvise(fh.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                loaded = _json_loads(fh.read())
+        except (OSError, ValueError):
+            loaded = {}
+        # Anything but {key: [saved_at, entries]} is dropped rather than trusted.
+        _channel_cache = {
+            k: v
+            for k, v in (loaded.items() if isinstance(loaded, dict) else ())
+            if _valid_cache_entry(v)
+        }
+    return _channel_cache
+
+
+def _valid_cache_entry(value) -> bool:
+    return (
+        isinstance(value, list)
+        and len(value) == 2
+        and isinstance(value[0], (int, float))
+        and isinstance(value[1], list)
+    )
+
+
+def _save_channel_cache():
+    cache = _load_channel_cache()
+    now = time.time()
+    for key in [k for k, (saved_at, _) in cache.items() if now - saved_at >= CHANNEL_CACHE_TTL]:
+        del cache[key]
+    tmp = CHANNEL_CACHE_FILE.with_suffix(".tmp")
     try:
-        with YoutubeDL(opts) as ydl:
-            ydl.download([url])
-        print(text["done"])
-    except Exception as exc:
-        print(text["error"].format(msg=exc))
-
-
-def fetch_channel_entries(channel_url: str, start: int, count: int) -> List[dict]:
-    ydl_opts = {
-        "quiet": True,
-        "extract_flat": True,
-        "skip_download": True,
-        "playliststart": start + 1,
-        "playlistend": start + count,
-    }
-    with YoutubeDL(ydl_opts) as ydl:
-        info = ydl.extract_info(channel_url, download=False)
-    return info.get("entries", [])
+        CHANNEL_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp, "wb") as fh:
+            fh.write(_json_dumps(cache))
+        os.replace(tmp, CHANNEL_CACHE_FILE)
+    except OSError:
+        pass  # The cache is an optimization; a read-only home must not break browsing.
 
 
-def browse_channel(text: Dict[str, str]):
-    url = normalize_channel_url(input(text["enter_channel"]).strip())
-    idx = 0
+def forget_channel_page(channel_url: str, start: int, count: int):
+    with _channel_cache_lock:
+        _load_channel_cache().pop(_cache_key(channel_url, start, count), None)
+        _save_channel_cache()
+
+
+def _cached_channel_page(channel_url: str, start: int, count: int) -> Optional[List[dict]]:
+    with _channel_cache_lock:
+        hit = _load_channel_cache().get(_cache_key(channel_url, start, count))
+    # Wall-clock time, not monotonic, because entries outlive the process.
+    if hit and time.time() - hit[0] < CHANNEL_CACHE_TTL:
+        return hit[1]
+    return None
+
+
+def _store_channel_page(channel_url: str, start: int, count: int, entries: List[dict]):
+    with _channel_cache_lock:
+        _load_channel_cache()[_cache_key(channel_url, start, count)] = [time.time(), entries]
+        _save_channel_cache()
+
+
+def _slim_entry(entry: dict) -> dict:
+    return {k: entry[k] for k in _CACHED_FIELDS if entry.get(k) is not None}
+
+
+def _channel_page(channel_url: str, start: int, count: int) -> List[dict]:
+    entries = _cached_channel_page(channel_url, start, count)
+    if entries is None:
+        entries = _fetch_channel_entries(channel_url, start, count)
+        _store_channel_page(channel_url, start, count, entries)
+    return entries
+
+
+async def fetch_channel_entries(channel_url: str, start: int, count: int) -> List[dict]:
+    """Return one page of entries, reusing results younger than CHANNEL_CACHE_TTL."""
+    return await _in_thread(_channel_page, channel_url, start, count)
+
+
+def _lazy_entries(ydl: YoutubeDL, url: str) -> Iterator[dict]:
+    info = ydl.extract_info(url, download=False, process=False)
+    # process=False does not follow redirects (watch?list=..., videoseries, regional
+    # channels), so resolve them here before looking for entries.
+    while info.get("_type") == "url" and info.get("url"):
+        info = ydl.extract_info(info["url"], download=False, process=False)
+    return iter(info.get("entries") or [])
+
+
+def _fetch_channel_entries(channel_url: str, start: int, count: int) -> List[dict]:
+    # process=False skips per-entry normalization; it also ignores playliststart/end,
+    # so the page is sliced out of the lazy entries here.
+    with YoutubeDL(copy.deepcopy(_BROWSE_OPTS)) as ydl:
+        entries = islice(_lazy_entries(ydl, channel_url), start, start + count)
+        return [_slim_entry(e) for e in entries]
+
+
+def print_entries(entries: List[dict]):
+    # One write for the whole listing instead of a write (and flush on a tty) per line.
+    lines = (f"{i}) {e.get('title', 'N/A')}" for i, e in enumerate(entries, start=1))
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _entry_url(entry: dict) -> str:
+    # Flat entries sometimes only carry the video id.
+    return entry.get("url") or entry.get("webpage_url") or f"https://youtu.be/{entry.get('id', '')}"
+
+
+async def fetch_many_channels(urls: List[str], page: int) -> Dict[str, Union[List[dict], Exception]]:
+    """Fetch the first page of every channel concurrently; failed channels map to their error."""
+    slots = asyncio.Semaphore(CHANNEL_FETCH_WORKERS)
+
+    async def first_page(url: str) -> List[dict]:
+        async with slots:
+            return await fetch_channel_entries(url, 0, page)
+
+    results = await asyncio.gather(*(first_page(u) for u in urls), return_exceptions=True)
+    return dict(zip(urls, results))
+
+
+async def browse_many_channels(text: Dict[str, str]):
+    urls = [normalize_channel_url(u) for u in await read_urls(text["enter_channels"])]
+    if not urls:
+        return
     page = 10
-    entries: List[dict] = []
-    while True:
-        entries = fetch_channel_entries(url, idx, page)
+    for url, entries in (await fetch_many_channels(urls, page)).items():
+        if isinstance(entries, Exception):
+            print(f"\n{url}")
+            print(text["error"].format(msg=entries))
+            continue
         if not entries:
-            # Try forcing /videos once more if user pasted a homepage URL
-            if "/videos" not in url:
-                url = normalize_channel_url(url + "/videos")
-                entries = fetch_channel_entries(url, idx, page)
-            if not entries:
-                print(text["error"].format(msg="No entries found."))
-                return
-            return
-        print(text["list_title"].format(count=len(entries)))
-        for i, e in enumerate(entries, start=1):
-            title = e.get("title", "N/A")
-            print(f"{i}) {title}")
-        choice = input(text["more"]).strip().lower()
-        if choice == "q":
-            return
-        if choice == "m":
-            idx += page
+            print(f"\n{url}")
+            print(text["error"].format(msg="No entries found."))
             continue
-        if choice.isdigit():
-            num = int(choice)
-            if 1 <= num <= len(entries):
-                video_url = entries[num - 1].get("url") or entries[num - 1].get(
-                    "webpage_url"
-                )
-                av = input(text["choose_av"]).strip()
-                is_video = av == "1"
-                fmt_choice = input(
-                    text["video_fmt"] if is_video else text["audio_fmt"]
-                ).strip()
-                download(video_url, is_video, fmt_choice, text)
-            else:
-                print(text["invalid"])
-        else:
-            print(text["invalid"])
+        print(text["list_title"].format(count=len(entries)), url)
+        print_entries(entries)
+
+
+class ChannelPager:
+    """Pages through one channel with a single lazy extractor walk.
+
+    Re-running extract_info per page makes yt-dlp walk the playlist from the first
+    entry every time; keeping the generator makes page K cost one page, not K.
+    Not thread-safe: callers must not request two pages at once.
+    """
+
+    def __init__(self, ydl: YoutubeDL, channel_url: str):
+        self.ydl = ydl
+        self.url = channel_url
+        self._entries: Optional[Iterator[dict]] = None
+        self._pos = 0
 
+    def page(self, start: int, count: int) -> List[dict]:
+        entries = _cached_channel_page(self.url, start, count)
+        if entries is not None:
+            return entries
+        if start < self._pos:
+            # The walk is already past this page (e.g. after a refresh); fetch it directly.
+            return _channel_page(self.url, start, count)
+        try:
+            if self._entries is None:
+                self._entries = _lazy_entries(self.ydl, self.url)
+            self._pos += sum(1 for _ in islice(self._entries, start - self._pos))
+            raw = list(islice(self._entries, count)) if self._pos == start else []
+        except Exception:
+            # A generator that raised is finished; start a fresh walk next time and
+            # never cache what the failed walk returned.
+            self._entries = None
+            self._pos = 0
+            raise
+        self._pos += len(raw)
+        entries = [_slim_entry(e) for e in raw]
+        _store_channel_page(self.url, start, count, entries)
+        return entries
 
-def main():
-    lang = pick_lang()
+
+async def browse_channel(text: Dict[str, str]):
+    url = normalize_channel_url((await ainput(text["enter_channel"])).strip())
+    idx = 0
+    page = 10
+    entries: List[dict] = []
+    prefetch: Optional[asyncio.Task] = None
+    with YoutubeDL(copy.deepcopy(_BROWSE_OPTS)) as ydl:
+        pager = ChannelPager(ydl, url)
+        try:
+            while True:
+                if prefetch is not None:
+                    # The pager is single-threaded; let the background page land first.
+                    await asyncio.wait([prefetch])
+                    # A failed prefetch cached nothing, so the page is fetched again below.
+                    prefetch.exception()
+                    prefetch = None
+                try:
+                    entries = await _in_thread(pager.page, idx, page)
+                    if not entries and "/videos" not in url:
+                        # Try forcing /videos once more if user pasted a homepage URL
+                        url = normalize_channel_url(url + "/videos")
+                        pager = ChannelPager(ydl, url)
+                        entries = await _in_thread(pager.page, idx, page)
+                except Exception as exc:
+                    print(text["error"].format(msg=exc))
+                    return
+                if not entries:
+                    print(text["error"].format(msg="No entries found."))
+                    return
+                print(text["list_title"].format(count=len(entries)))
+                print_entries(entries)
+                if len(entries) == page:
+                    # Not cancelled on other choices: the page still lands in the cache, and
+                    # cancelling the task would not stop its thread from using the pager.
+                    prefetch = asyncio.create_task(_in_thread(pager.page, idx + page, page))
+                choice = (await ainput(text["more"])).strip().lower()
+                if choice == "q":
+                    return
+                if choice == "m":
+                    idx += page
+                    continue
+                if choice == "r":
+                    forget_channel_page(url, idx, page)
+                    continue
+                if choice.isdigit():
+                    num = int(choice)
+                    if 1 <= num <= len(entries):
+                        video_url = _entry_url(entries[num - 1])
+                        av = (await ainput(text["choose_av"])).strip()
+                        is_video = av == "1"
+                        fmt_choice = (
+                            await ainput(text["video_fmt"] if is_video else text["audio_fmt"])
+                        ).strip()
+                        await download([video_url], is_video, fmt_choice, text)
+                    else:
+                        print(text["invalid"])
+                else:
+                    print(text["invalid"])
+        except KeyboardInterrupt:
+            # The process is exiting; waiting here would hold Ctrl+C until the page lands.
+            prefetch = None
+            raise
+        finally:
+            # A running prefetch still uses ydl; let it finish before the with-block closes it.
+            if prefetch is not None:
+                await asyncio.wait([prefetch])
+                prefetch.exception()
+
+
+async def main():
+    lang = await pick_lang()
     text = LANG[lang]
     while True:
-        choice = input(text["menu"]).strip()
+        choice = (await ainput(text["menu"])).strip()
         if choice == "1":
-            url = input(text["enter_url"]).strip()
-            av = input(text["choose_av"]).strip()
+            url = (await ainput(text["enter_url"])).strip()
+            av = (await ainput(text["choose_av"])).strip()
             is_video = av == "1"
-            fmt_choice = input(
-                text["video_fmt"] if is_video else text["audio_fmt"]
+            fmt_choice = (
+                await ainput(text["video_fmt"] if is_video else text["audio_fmt"])
             ).strip()
-            download(url, is_video, fmt_choice, text)
+            await download([url], is_video, fmt_choice, text)
         elif choice == "2":
-            browse_channel(text)
+            await browse_channel(text)
         elif choice == "3":
+            urls = await read_urls(text["enter_urls"])
+            if not urls:
+                continue
+            av = (await ainput(text["choose_av"])).strip()
+            is_video = av == "1"
+            fmt_choice = (
+                await ainput(text["video_fmt"] if is_video else text["audio_fmt"])
+            ).strip()
+            await download(urls, is_video, fmt_choice, text)
+        elif choice == "4":
+            await browse_many_channels(text)
+        elif choice == "5":
             break
         else:
             print(text["invalid"])
 
 
+def run():
+    # Not asyncio.run: its SIGINT handler only cancels the main task, which cannot stop a
+    # blocked input(), and it then joins worker threads before exiting.
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(main())
+    except KeyboardInterrupt:
+        # Running downloads stop at their next progress hook; daemon threads do not
+        # hold up the exit.
+        _cancel_downloads.set()
+        print()
+        sys.exit(130)
+    else:
+        loop.close()
+
+
 if __name__ == "__main__":
-    main()
+    run()